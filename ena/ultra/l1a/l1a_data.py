@@ -61,7 +61,15 @@ def l1a_data_products(l0_data, xcte_definition):
     # for each packet in data file:
         # unpack data using APID and its packet definition
         # store unpacked data in a CDF variable or array
-    
+    #
+    # NOTE: Direct Events should be unpacked column-wise, i.e. one numpy array
+    # per field (Table 1) with one entry per event, instead of one object or
+    # dict per event. CDF variables are already stored per field, and later
+    # steps (event time, culling) only read a few fields across many events.
+    # Give each field the smallest unsigned integer dtype that holds its bit
+    # width (e.g. uint8 for fields up to 8 bits, uint16 up to 16 bits) instead
+    # of promoting everything to 64-bit integers.
+
     # NOTE:
     # How do we get packets from MOC? One day's worth of data in one zip file?
     # Does it contain many packets with different APID?
@@ -63,7 +63,12 @@ def l1b_data_products():
 
     Formula to calculate event time:
         t_event = t_spin_start + (t_start_sub / 1000) + ((t_spin_duration/ 1000) * (theta_event / 720))
-    
+
+    The spin values come from the most recent auxiliary packet before each event. Rather than
+    searching back for it per event, find all of them at once with
+    np.searchsorted(aux_time, event_packet_time, side='right') - 1 (aux_time is sorted), then
+    apply the formula above to whole arrays.
+
     This event time will later be used for grouping events into the appropriate pointing sets, can aid
     in the determination of spatiotemporal noise and the creation of a bad times list. Event time can
     also be used to determine which events belong to a given Pointing.